@@ -23,6 +23,7 @@ except ImportError:
 ###############################################################################
 class AwsObject(base.BotoObject):
     """AWS 'key' object wrapper."""
+    __slots__ = ()
 
     @classmethod
     @requires(boto, 'boto')
@@ -14,7 +14,22 @@ class CloudObjectTypes(object):
 
 
 class CloudObject(object):
-    """Cloud object wrapper."""
+    """Cloud object wrapper.
+
+    Listings can create many objects at once, so instance attributes are
+    declared with ``__slots__`` (which subclasses should also declare).
+    """
+    __slots__ = (
+        'container',
+        'name',
+        'size',
+        'content_type',
+        'content_encoding',
+        'last_modified',
+        'type',
+        '__native',
+    )
+
     type_cls = CloudObjectTypes
 
     def __init__(self, container, name, **kwargs):
@@ -53,6 +53,8 @@ class BotoBucketWrapper(errors.CloudExceptionWrapper):
 
 class BotoObject(base.CloudObject):
     """Boto 'key' object wrapper."""
+    __slots__ = ()
+
     #: Exception translations.
     wrap_boto_errors = BotoKeyWrapper()
 
@@ -98,15 +98,17 @@ class CloudExceptionWrapper(object):
 
         return obj
 
-    @classmethod
-    def excepts(cls):
+    def excepts(self):
         """Return tuple of underlying exception classes to trap and wrap.
 
+        Computed from the instance translations, which may have been patched
+        in from :meth:`lazy_translations`.
+
         :rtype: ``tuple`` of ``type``
         """
-        if cls._excepts is None:
-            cls._excepts = tuple(cls.translations.keys())
-        return cls._excepts
+        if self._excepts is None:
+            self._excepts = tuple(self.translations.keys())
+        return self._excepts
 
     def translate(self, exc):
         """Return translation of exception to new class.
@@ -115,9 +117,9 @@ class CloudExceptionWrapper(object):
         in, else ``None`` (which signifies no wrapping should be done).
         """
         # Find actual class.
-        for key in self.translations.keys():
+        for key, new_cls in self.translations.iteritems():
             if isinstance(exc, key):
-                return self.translations[key](unicode(exc))
+                return new_cls(unicode(exc))
 
         return None
 
@@ -46,6 +46,7 @@ wrap_fs_obj_errors = FilesystemObjectWrapper()  # pylint: disable=C0103
 
 class FilesystemObject(base.CloudObject):
     """Filesystem object wrapper."""
+    __slots__ = ()
 
     def _get_object(self):
         """Return native storage object."""
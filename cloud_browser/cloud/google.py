@@ -29,6 +29,7 @@ except ImportError:
 ###############################################################################
 class GsObject(base.BotoObject):
     """Google Storage 'key' object wrapper."""
+    __slots__ = ()
 
     _gs_folder_suffix = "_$folder$"
 
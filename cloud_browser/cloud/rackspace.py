@@ -7,6 +7,8 @@
 
 .. _cloudfiles: https://github.com/rackspace/python-cloudfiles
 """
+import time
+
 from cloud_browser.app_settings import settings
 from cloud_browser.cloud import errors, base
 from cloud_browser.common import SEP, check_version, requires, dt_from_header
@@ -21,6 +23,12 @@ RS_MIN_CLOUDFILES_VERSION = (1, 7, 4)
 RS_MAX_LIST_OBJECTS_LIMIT = 10000
 RS_MAX_LIST_CONTAINERS_LIMIT = 10000
 
+# Seconds to cache native container objects for (per connection).
+RS_CONTAINER_CACHE_TTL = 5
+
+# Maximum number of memoized ``last_modified`` date string conversions.
+RS_MAX_DT_CACHE_SIZE = 4096
+
 try:
     import cloudfiles  # pylint: disable=F0401
     check_version(cloudfiles, RS_MIN_CLOUDFILES_VERSION)
@@ -28,6 +36,30 @@ except ImportError:
     cloudfiles = None  # pylint: disable=C0103
 
 
+###############################################################################
+# Helpers
+###############################################################################
+_DT_CACHE = {}
+
+
+def dt_from_cached_header(date_str):
+    """Memoized version of :func:`cloud_browser.common.dt_from_header`.
+
+    Objects in a listing frequently share the same modified timestamp (e.g.,
+    bulk uploads), so we keep a bounded cache of converted date strings.
+    """
+    try:
+        return _DT_CACHE[date_str]
+    except KeyError:
+        pass
+
+    if len(_DT_CACHE) >= RS_MAX_DT_CACHE_SIZE:
+        _DT_CACHE.clear()
+
+    _DT_CACHE[date_str] = date_time = dt_from_header(date_str)
+    return date_time
+
+
 ###############################################################################
 # Classes
 ###############################################################################
@@ -46,13 +78,15 @@ class RackspaceExceptionWrapper(errors.CloudExceptionWrapper):
 
 class RackspaceObject(base.CloudObject):
     """Cloud object wrapper."""
+    __slots__ = ()
+
     #: Exception translations.
     wrap_rs_errors = RackspaceExceptionWrapper()
 
     #: Subdirectory content types.
     #: Rackspace has "special" content types that should be interpreted as
     #: pseudo-directory delimiters from "old style" hierarchy detection.
-    subdir_types = set((
+    subdir_types = frozenset((
         "application/directory",
         "application/folder",
     ))
@@ -91,23 +125,27 @@ class RackspaceObject(base.CloudObject):
     def from_file_info(cls, container, info_obj):
         """Create from regular info object."""
         # RFC 8601: 2010-04-15T01:52:13.919070
+        content_type = info_obj['content_type']
+        last_modified = dt_from_cached_header(info_obj['last_modified'])
         return cls(container,
                    name=info_obj['name'],
                    size=info_obj['bytes'],
-                   content_type=info_obj['content_type'],
-                   last_modified=dt_from_header(info_obj['last_modified']),
-                   obj_type=cls.choose_type(info_obj['content_type']))
+                   content_type=content_type,
+                   last_modified=last_modified,
+                   obj_type=cls.choose_type(content_type))
 
     @classmethod
     def from_obj(cls, container, file_obj):
         """Create from regular info object."""
         # RFC 1123: Thu, 07 Jun 2007 18:57:07 GMT
+        content_type = file_obj.content_type
+        last_modified = dt_from_cached_header(file_obj.last_modified)
         return cls(container,
                    name=file_obj.name,
                    size=file_obj.size,
-                   content_type=file_obj.content_type,
-                   last_modified=dt_from_header(file_obj.last_modified),
-                   obj_type=cls.choose_type(file_obj.content_type))
+                   content_type=content_type,
+                   last_modified=last_modified,
+                   obj_type=cls.choose_type(content_type))
 
 
 class RackspaceContainer(base.CloudContainer):
@@ -120,20 +158,20 @@ class RackspaceContainer(base.CloudContainer):
 
     #: Maximum number of objects that can be listed or ``None``.
     #:
-    #: Enforced Rackspace maximums. We need a lower max. to be enforced on
-    #: the input end because under the hood, we can try subsequent larger
-    #: queries if we have marker or psuedo/dummy directory clashes.
+    #: Listings over the Rackspace maximum are paged through under the hood,
+    #: but we still keep the listing size bounded to a single Rackspace query
+    #: on the input end.
     #:
     #: Specifically, we need to add one to the query to detect a
-    #: pseudo-directory matching the marker, and double the limit for a
-    #: follow-on query if we have both dummy and pseudo-directory objects
-    #: in results.
-    max_list = (RS_MAX_LIST_OBJECTS_LIMIT - 1) / 2
+    #: pseudo-directory matching the marker. Any dummy and pseudo-directory
+    #: object clashes are handled with follow-on queries.
+    max_list = RS_MAX_LIST_OBJECTS_LIMIT - 1
 
-    @wrap_rs_errors
     def _get_container(self):
         """Return native container object."""
-        return self.conn.native_conn.get_container(self.name)
+        return self.conn.get_native_container(self.name,
+                                              self.count,
+                                              self.size)
 
     @wrap_rs_errors
     def get_objects(self, path, marker=None,
@@ -157,69 +195,76 @@ class RackspaceContainer(base.CloudContainer):
         object and an implied subdirectory. To remedy this situation, we only
         show information for the dummy directory object in results if present,
         and ignore the implied subdirectory. But, under the hood this means
-        that our `limit` parameter may end up with less than the desired
-        number of objects. So, we use the heuristic that if we **do** have
-        "application/directory" objects, we end up doing an extra query of
-        double the limit size to ensure we can get up to the limit amount
-        of objects. This double query approach is inefficient, but as
-        using dummy objects should now be deprecated, the second query should
-        only rarely occur.
+        that a single query of `limit` size may end up with less than the
+        desired number of objects. So, if we **do** have
+        "application/directory" objects, we continue with a follow-on query
+        starting from the last raw result to fill up to the limit amount of
+        objects. As using dummy objects should now be deprecated, the
+        follow-on query should only rarely occur.
 
         """
-        object_infos, full_query = self._get_object_infos(path, marker, limit)
-        if full_query and len(object_infos) < limit:
-            # The underlying query returned a full result set, but we
-            # truncated it to under limit. Re-run at twice the limit and then
-            # slice back.
-            object_infos, _ = self._get_object_infos(path, marker, 2*limit)
-            object_infos = object_infos[:limit]
-
+        object_infos = self._get_object_infos(path, marker, limit)
         return [self.obj_cls.from_info(self, x) for x in object_infos]
 
     @wrap_rs_errors
     def _get_object_infos(self, path, marker=None,
                           limit=settings.CLOUD_BROWSER_DEFAULT_LIST_LIMIT):
-        """Get raw object infos (single-shot)."""
-        # Adjust limit to +1 to handle marker object as first result.
-        # We can get in to this situation for a marker of "foo", that will
-        # still return a 'subdir' object of "foo/" because of the extra
-        # slash.
-        orig_limit = limit
-        limit += 1
+        """Return raw object infos (as a list or a lazy iterator).
 
-        # Enforce maximum object size.
-        if limit > RS_MAX_LIST_OBJECTS_LIMIT:
-            raise errors.CloudException("Object limit must be less than %s" %
-                                        RS_MAX_LIST_OBJECTS_LIMIT)
+        Only the first query is issued up front. If follow-on queries are
+        needed, they are issued as the returned iterator is consumed.
+        """
+        from itertools import chain, islice
 
-        def _collapse(infos):
+        def _collapse(infos, name=None):
             """Remove duplicate dummy / implied objects."""
-            name = None
             for info in infos:
-                name = info.get('name', name)
-                subdir = info.get('subdir', '').strip(SEP)
-                if not name or subdir != name:
+                if 'subdir' in info:
+                    if not name or info['subdir'].strip(SEP) != name:
+                        yield info
+                else:
+                    name = info['name']
                     yield info
 
+        # Adjust page size to +1 to handle marker object as first result.
+        # We can get in to this situation for a marker of "foo", that will
+        # still return a 'subdir' object of "foo/" because of the extra
+        # slash. Seeding the collapse with the marker skips such an object.
         path = path + SEP if path else ''
-        object_infos = self.native_container.list_objects_info(
-            limit=limit, delimiter=SEP, prefix=path, marker=marker)
-
-        full_query = len(object_infos) == limit
-        if object_infos:
-            # Check first object for marker match and truncate if so.
-            if (marker and
-                    object_infos[0].get('subdir', '').strip(SEP) == marker):
-                object_infos = object_infos[1:]
-
-            # Collapse subdirs and dummy objects.
-            object_infos = list(_collapse(object_infos))
+        page_limit = min(limit + 1, RS_MAX_LIST_OBJECTS_LIMIT)
+        pages = self._iter_object_pages(path, marker, page_limit)
+        object_infos = pages.next()
+
+        # Specialize for the common case: without implied subdirectories,
+        # there is nothing to collapse, so if the first query has all of the
+        # objects we need, use it directly.
+        if ((len(object_infos) >= limit or len(object_infos) < page_limit) and
+                not any('subdir' in info for info in object_infos)):
+            return object_infos[:limit]
+
+        # Collapse subdirs and dummy objects, paging through further results
+        # only if needed to get up to the limit.
+        object_infos = (info for infos in chain([object_infos], pages)
+                        for info in infos)
+        return islice(_collapse(object_infos, marker), limit)
+
+    def _iter_object_pages(self, prefix, marker, page_limit):
+        """Yield lists of raw object infos, from queries of ``page_limit``.
+
+        Further queries use the last returned object (or subdirectory) name as
+        the marker and are only issued as results are consumed, until a
+        query returns less than a full page.
+        """
+        while True:
+            infos = self.native_container.list_objects_info(
+                limit=page_limit, delimiter=SEP, prefix=prefix, marker=marker)
+            yield infos
 
-            # Adjust to original limit.
-            if len(object_infos) > orig_limit:
-                object_infos = object_infos[:orig_limit]
+            if len(infos) < page_limit:
+                break
 
-        return object_infos, full_query
+            last = infos[-1]
+            marker = last['subdir'] if 'subdir' in last else last['name']
 
     @wrap_rs_errors
     def get_object(self, path):
@@ -244,6 +289,7 @@ class RackspaceConnection(base.CloudConnection):
         super(RackspaceConnection, self).__init__(account, secret_key)
         self.servicenet = servicenet
         self.authurl = authurl
+        self.__native_containers = {}
 
     @wrap_rs_errors
     @requires(cloudfiles, 'cloudfiles')
@@ -271,10 +317,34 @@ class RackspaceConnection(base.CloudConnection):
         return [self.cont_cls(self, i['name'], i['count'], i['bytes'])
                 for i in infos]
 
+    @wrap_rs_errors
+    def get_native_container(self, name, count=None, size=None):
+        """Return native container object.
+
+        Native containers are cached for ``RS_CONTAINER_CACHE_TTL`` seconds,
+        as typical views look up the same container more than once.
+
+        If the object count and size are already known (e.g., from a container
+        listing), the native container is created directly from them instead
+        of querying the container.
+        """
+        now = time.time()
+        cont, expires = self.__native_containers.get(name, (None, 0))
+        if cont is None or expires <= now:
+            if count is None or size is None:
+                cont = self.native_conn.get_container(name)
+            else:
+                cont = cloudfiles.Container(self.native_conn, name,
+                                            count, size)
+            self.__native_containers[name] = (cont,
+                                              now + RS_CONTAINER_CACHE_TTL)
+
+        return cont
+
     @wrap_rs_errors
     def _get_container(self, path):
         """Return single container."""
-        cont = self.native_conn.get_container(path)
+        cont = self.get_native_container(path)
         return self.cont_cls(self,
                              cont.name,
                              cont.object_count,
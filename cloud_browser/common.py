@@ -6,6 +6,10 @@ Because cloud operations are OS agnostic, we don't use any of :mod:`os` or
 from datetime import datetime
 from django.core.exceptions import ImproperlyConfigured
 
+try:
+    import ciso8601  # pylint: disable=F0401
+except ImportError:
+    ciso8601 = None  # pylint: disable=C0103
 
 ###############################################################################
 # Constants.
@@ -16,6 +20,17 @@ SEP = "/"
 #: Parent path phrase.
 PARENT = ".."
 
+# Date / time constants.
+#: RFC 1123 weekday abbreviations.
+RFC1123_WEEKDAYS = frozenset((
+    'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun',
+))
+#: RFC 1123 month abbreviations to month numbers.
+RFC1123_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
 
 ###############################################################################
 # General.
@@ -76,13 +91,39 @@ def requires(module, name=""):
 def dt_from_rfc8601(date_str):
     """Convert 8601 (ISO) date string to datetime object.
 
-    Handles "Z" and milliseconds transparently.
+    Handles "Z" and milliseconds transparently. Uses the ciso8601_ C parser
+    if it is installed.
+
+    .. _ciso8601: https://github.com/closeio/ciso8601
 
     :param date_str: Date string.
     :type  date_str: ``string``
     :return: Date time.
     :rtype:  :class:`datetime.datetime`
     """
+    # Fast path: for the fixed-width form, parse the fields (ignoring
+    # milliseconds and "Z") directly, which avoids normalizing the string and
+    # the (comparatively slow) :meth:`datetime.strptime` format parsing.
+    if (date_str[4:17:3] == "--T::" and
+            (date_str[19:20] in ('', '.') or date_str[19:] == 'Z')):
+        if ciso8601 is not None:
+            # Only pass the (naive) seconds portion, as ciso8601 may require
+            # extra packages to parse time zone information.
+            try:
+                date_time = ciso8601.parse_datetime(date_str[:19])
+            except (ImportError, ValueError):
+                date_time = None
+
+            if date_time is not None:
+                return date_time
+
+        try:
+            return datetime(int(date_str[0:4]), int(date_str[5:7]),
+                            int(date_str[8:10]), int(date_str[11:13]),
+                            int(date_str[14:16]), int(date_str[17:19]))
+        except ValueError:
+            pass
+
     # Normalize string and adjust for milliseconds. Note that Python 2.6+ has
     # ".%f" format, but we're going for Python 2.5, so truncate the portion.
     date_str = date_str.rstrip('Z').split('.')[0]
@@ -104,6 +145,22 @@ def dt_from_rfc1123(date_str):
     :return: Date time.
     :rtype:  :class:`datetime.datetime`
     """
+    # Fast path: slice the fixed-width fields directly and look up the month
+    # number, avoiding the locale-dependent :meth:`datetime.strptime`.
+    # (Thu, 07 Jun 2007 18:57:07 GMT)
+    if (len(date_str) == 29 and date_str[25:] == " GMT" and
+            date_str[3:5] == ", " and
+            date_str[7] == date_str[11] == date_str[16] == " " and
+            date_str[19] == date_str[22] == ":" and
+            date_str[0:3] in RFC1123_WEEKDAYS):
+        try:
+            return datetime(int(date_str[12:16]),
+                            RFC1123_MONTHS[date_str[8:11]],
+                            int(date_str[5:7]), int(date_str[17:19]),
+                            int(date_str[20:22]), int(date_str[23:25]))
+        except (KeyError, ValueError):
+            pass
+
     fmt = "%a, %d %b %Y %H:%M:%S GMT"
     return datetime.strptime(date_str, fmt)
 